@@ -4,18 +4,60 @@ Unity Project Analyzer
 Analyzes a Unity project and generates metrics on code structure, complexity, and organization.
 """
 
+import io
 import os
 import sys
 import re
+import functools
+import heapq
+import pickle
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 
-@dataclass
+# Patterns are compiled once and are bytes, so scripts are scanned undecoded.
+# Bytes \w is ASCII-only, so identifier characters are spelled [\w\x80-\xff]:
+# in UTF-8, bytes of 0x80 and up only occur inside non-ASCII characters.
+_CLASS_RE = re.compile(rb'class(?<![\w\x80-\xff]class)\s+[\w\x80-\xff]+', re.ASCII)
+# Methods and fields share the access-modifier prefix, so one scan finds
+# both; a match is a method when the parameter-list group took part.
+_MEMBER_RE = re.compile(rb'(?:public|private|protected|internal)\s+[\w\x80-\xff]+\s+[\w\x80-\xff]+\s*(?:(\([^)]*\)\s*{)|[;=])', re.ASCII)
+_PROPERTY_RE = re.compile(rb'property(?<![\w\x80-\xff]property)\s+[\w\x80-\xff]+|{\s*get\s*;', re.ASCII)
+_USING_RE = re.compile(rb'using\s+([\w\x80-\xff.]+);', re.ASCII)
+# All branch keywords in one alternation so they take a single pass; the
+# '&&' and '||' operators are plain substrings and are counted with bytes.count.
+_BRANCH_KEYWORD_RE = re.compile(rb'\b(?<![\x80-\xff])(?:if|else|for|foreach|while|case|catch)\b(?![\x80-\xff])', re.ASCII)
+# Line classification. A block comment match covers every line it touches,
+# from the start of the line holding '/*' to the end of the first line,
+# that one included, holding '*/' anywhere, so '/*/' opens and closes.
+_BLOCK_COMMENT_RE = re.compile(rb'^(?=[^\n]*/\*).*?(?:\*/[^\n]*|\Z)', re.ASCII | re.MULTILINE | re.DOTALL)
+_LINE_COMMENT_RE = re.compile(rb'^[ \t\r\f\v]*//', re.ASCII | re.MULTILINE)
+_BLANK_LINE_RE = re.compile(rb'^[ \t\r\f\v]*$', re.ASCII | re.MULTILINE)
+
+# Scripts are analyzed in worker processes once there are enough of them to
+# outweigh pool start-up; chunking keeps per-file IPC overhead low.
+_PARALLEL_MIN_SCRIPTS = 64
+_PARALLEL_CHUNKSIZE = 16
+
+# Script results are cached between runs, keyed on absolute path and
+# validated against the file's mtime and size. Bump the version whenever
+# ScriptMetrics or the counting rules change so stale entries are dropped.
+_CACHE_PATH = Path('~/.cache/unity_analyzer.pkl').expanduser()
+_CACHE_VERSION = 5
+
+# Scripts under these directories, or larger than this many bytes, are
+# usually generated or third-party code. Only their lines are counted, and
+# they are left out of the complexity, ranking and issue sections.
+_LINES_ONLY_DIRS = frozenset({'Generated', 'Plugins', 'ThirdParty'})
+_LINES_ONLY_OVER_BYTES = 200_000
+
+@dataclass(slots=True)
 class ScriptMetrics:
     """Metrics for a single C# script."""
     path: str
+    name: str = ""  # File name, cached for reporting
     lines_of_code: int = 0
     comment_lines: int = 0
     blank_lines: int = 0
@@ -25,8 +67,9 @@ class ScriptMetrics:
     field_count: int = 0
     complexity: int = 0  # Cyclomatic complexity estimate
     dependencies: Set[str] = field(default_factory=set)
+    lines_only: bool = False  # Generated/third-party: only line counts collected
 
-@dataclass
+@dataclass(slots=True)
 class ProjectMetrics:
     """Overall project metrics."""
     total_scripts: int = 0
@@ -34,76 +77,207 @@ class ProjectMetrics:
     total_comments: int = 0
     scripts_by_directory: Dict[str, List[str]] = field(default_factory=lambda: defaultdict(list))
     script_metrics: List[ScriptMetrics] = field(default_factory=list)
+    lines_only_scripts: List[ScriptMetrics] = field(default_factory=list)
     prefab_count: int = 0
     scene_count: int = 0
     animation_count: int = 0
     material_count: int = 0
 
-def count_lines(file_path: str) -> ScriptMetrics:
-    """Analyze a single C# script file."""
+def _count_matches(pattern: re.Pattern, content: bytes) -> int:
+    """Count non-overlapping matches without building a list of them."""
+    return sum(1 for _ in pattern.finditer(content))
+
+def _as_line_comments(match: re.Match) -> bytes:
+    """Replace a block comment match with the same number of '//' lines."""
+    # Count newlines in the source buffer rather than copying the match out
+    newlines = match.string.count(b'\n', match.start(), match.end())
+    return b'//' + b'\n//' * newlines
+
+def analyze_source(file_path: str, content: bytes, lines_only: bool = False) -> ScriptMetrics:
+    """Analyze the already-loaded bytes of a single C# script.
+    
+    With lines_only, or for very large scripts, only the line counts are taken.
+    """
     metrics = ScriptMetrics(path=file_path)
     
+    # Rewrite block comments as '//' lines so a single scan per
+    # category classifies every line without a per-line loop.
+    if b'/*' in content:
+        classified = _BLOCK_COMMENT_RE.sub(_as_line_comments, content)
+    else:
+        classified = content
+    
+    total_lines = content.count(b'\n') + 1
+    metrics.blank_lines = _count_matches(_BLANK_LINE_RE, classified)
+    metrics.comment_lines = _count_matches(_LINE_COMMENT_RE, classified)
+    metrics.lines_of_code = total_lines - metrics.blank_lines - metrics.comment_lines
+    
+    if lines_only or len(content) > _LINES_ONLY_OVER_BYTES:
+        metrics.lines_only = True
+        return metrics
+    
+    # Count classes
+    metrics.class_count = _count_matches(_CLASS_RE, content)
+    
+    # Count methods and fields (public, private, protected, internal)
+    for member in _MEMBER_RE.finditer(content):
+        if member.lastindex:
+            metrics.method_count += 1
+        else:
+            metrics.field_count += 1
+    
+    # Count properties
+    metrics.property_count = _count_matches(_PROPERTY_RE, content)
+    
+    # Estimate cyclomatic complexity
+    metrics.complexity = _count_matches(_BRANCH_KEYWORD_RE, content) + \
+                         content.count(b'&&') + content.count(b'||')
+    
+    # Find dependencies (using statements)
+    metrics.dependencies = {dep.decode('utf-8', errors='ignore') for dep in _USING_RE.findall(content)}
+    
+    return metrics
+
+def count_lines(file_path: str, lines_only: bool = False) -> Optional[ScriptMetrics]:
+    """Analyze a single C# script file, or return None if it can't be read."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+        with open(file_path, 'rb') as f:
             content = f.read()
-            lines = content.split('\n')
-            
-            in_multiline_comment = False
-            
-            for line in lines:
-                stripped = line.strip()
-                
-                # Handle multiline comments
-                if '/*' in stripped:
-                    in_multiline_comment = True
-                if '*/' in stripped:
-                    in_multiline_comment = False
-                    metrics.comment_lines += 1
-                    continue
-                
-                if in_multiline_comment:
-                    metrics.comment_lines += 1
-                elif not stripped:
-                    metrics.blank_lines += 1
-                elif stripped.startswith('//'):
-                    metrics.comment_lines += 1
-                else:
-                    metrics.lines_of_code += 1
-            
-            # Count classes
-            metrics.class_count = len(re.findall(r'\bclass\s+\w+', content))
-            
-            # Count methods (public, private, protected)
-            metrics.method_count = len(re.findall(
-                r'(public|private|protected|internal)\s+\w+\s+\w+\s*\([^)]*\)\s*{',
-                content
-            ))
-            
-            # Count properties
-            metrics.property_count = len(re.findall(r'\bproperty\s+\w+', content)) + \
-                                    len(re.findall(r'{\s*get\s*;', content))
-            
-            # Count fields
-            metrics.field_count = len(re.findall(
-                r'(public|private|protected|internal)\s+\w+\s+\w+\s*[;=]',
-                content
-            ))
-            
-            # Estimate cyclomatic complexity
-            complexity_keywords = ['if', 'else', 'for', 'foreach', 'while', 'case', 'catch', '&&', '||']
-            for keyword in complexity_keywords:
-                metrics.complexity += len(re.findall(r'\b' + keyword + r'\b', content))
-            
-            # Find dependencies (using statements)
-            using_pattern = r'using\s+([\w.]+);'
-            metrics.dependencies = set(re.findall(using_pattern, content))
-            
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
+        return None
     
-    return metrics
+    return analyze_source(file_path, content, lines_only)
 
-def analyze_unity_project(project_path: str) -> ProjectMetrics:
+def _scan_assets(assets_path: Path, scripts_path: Path) -> Tuple[Counter, List[Path], Path]:
+    """Walk Assets/ once, counting files by extension and collecting scripts.
+    
+    Hidden directories (such as .git) are skipped, as Unity ignores them too,
+    and so are directories that can't be read. Like rglob, linked directories
+    are not descended into, except for the scripts folder itself. That folder
+    is matched by file identity rather than by spelling, so case-insensitive
+    filesystems find Assets/scripts as well; it is returned as spelled on disk.
+    """
+    extension_counts = Counter()
+    cs_files = []
+    found_scripts_path = scripts_path
+    try:
+        scripts_stat = os.stat(scripts_path)
+    except OSError:
+        scripts_stat = None
+    
+    def walk(directory: str, in_scripts: bool):
+        nonlocal found_scripts_path
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            return
+        with entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name.startswith('.'):
+                        continue
+                    # os.stat rather than entry.stat(), which has no inode on Windows
+                    is_scripts = (not in_scripts and scripts_stat is not None
+                                  and entry.name.lower() == scripts_path.name.lower()
+                                  and os.path.samestat(os.stat(entry.path), scripts_stat))
+                    if is_scripts:
+                        found_scripts_path = Path(entry.path)
+                    if is_scripts or not entry.is_symlink():
+                        walk(entry.path, in_scripts or is_scripts)
+                    continue
+                extension = os.path.splitext(entry.name)[1]
+                extension_counts[extension] += 1
+                if in_scripts and extension == '.cs':
+                    cs_files.append(Path(entry.path))
+    
+    walk(str(assets_path), False)
+    return extension_counts, cs_files, found_scripts_path
+
+def _load_cache() -> Dict[str, Tuple[int, int, ScriptMetrics]]:
+    """Load cached script results, or an empty cache if none is usable."""
+    try:
+        with open(_CACHE_PATH, 'rb') as f:
+            version, entries = pickle.load(f)
+    except Exception:
+        return {}
+    return entries if version == _CACHE_VERSION else {}
+
+def _save_cache(entries: Dict[str, Tuple[int, int, ScriptMetrics]]):
+    """Write cached script results, replacing the cache file atomically."""
+    temp_path = _CACHE_PATH.with_name(f"{_CACHE_PATH.name}.{os.getpid()}.tmp")
+    try:
+        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(temp_path, 'wb') as f:
+            pickle.dump((_CACHE_VERSION, entries), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, _CACHE_PATH)
+    except Exception as e:
+        print(f"Warning: could not write cache {_CACHE_PATH}: {e}")
+
+def _file_stamp(file_path: str) -> Optional[Tuple[str, int, int]]:
+    """Return (absolute path, mtime in ns, size) for a file, or None if it can't be stat'ed."""
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size
+
+def _analyze_scripts(file_paths: List[str], lines_only: List[bool], assets_path: Path,
+                     use_cache: bool = True) -> List[ScriptMetrics]:
+    """Run count_lines over every script, reusing cached results for unchanged files.
+    
+    lines_only is index-aligned with file_paths and is passed on to count_lines.
+    Cached entries under assets_path for scripts not seen in this run are dropped.
+    """
+    cache = _load_cache() if use_cache else {}
+    results: List[Optional[ScriptMetrics]] = []
+    misses = []
+    seen = set()
+    
+    for file_path, line_count_only in zip(file_paths, lines_only):
+        stamp = _file_stamp(file_path)
+        if stamp:
+            seen.add(stamp[0])
+        entry = cache.get(stamp[0]) if stamp else None
+        if entry is not None and entry[:2] == stamp[1:]:
+            script_metrics = entry[2]
+            script_metrics.path = file_path
+            results.append(script_metrics)
+        else:
+            misses.append((len(results), file_path, line_count_only, stamp))
+            results.append(None)
+    
+    miss_paths = [file_path for _, file_path, _, _ in misses]
+    miss_lines_only = [line_count_only for _, _, line_count_only, _ in misses]
+    if len(miss_paths) >= _PARALLEL_MIN_SCRIPTS:
+        with ProcessPoolExecutor() as executor:
+            computed = list(executor.map(count_lines, miss_paths, miss_lines_only, chunksize=_PARALLEL_CHUNKSIZE))
+    else:
+        computed = [count_lines(file_path, line_count_only)
+                    for file_path, line_count_only in zip(miss_paths, miss_lines_only)]
+    
+    for (index, file_path, _, stamp), script_metrics in zip(misses, computed):
+        if script_metrics is None:
+            # Unreadable: report it empty, but don't cache it against a stamp
+            # that a later permissions fix won't change
+            results[index] = ScriptMetrics(path=file_path)
+            continue
+        results[index] = script_metrics
+        if stamp:
+            cache[stamp[0]] = (stamp[1], stamp[2], script_metrics)
+    
+    # Evict deleted or renamed scripts from this project; other projects keep theirs
+    assets_prefix = os.path.join(os.path.abspath(assets_path), '')
+    stale = [path for path in cache if path.startswith(assets_prefix) and path not in seen]
+    for path in stale:
+        del cache[path]
+    
+    if use_cache and (misses or stale):
+        _save_cache(cache)
+    
+    return results
+
+def analyze_unity_project(project_path: str, use_cache: bool = True) -> ProjectMetrics:
     """Analyze the entire Unity project."""
     project_path = Path(project_path)
     assets_path = project_path / "Assets"
@@ -114,129 +288,145 @@ def analyze_unity_project(project_path: str) -> ProjectMetrics:
     
     metrics = ProjectMetrics()
     
+    # Walk Assets/ once for both the scripts and the asset counts
+    extension_counts, cs_files, scripts_path = _scan_assets(assets_path, assets_path / "Scripts")
+    
     # Analyze C# scripts
-    scripts_path = assets_path / "Scripts"
-    if scripts_path.exists():
-        for cs_file in scripts_path.rglob("*.cs"):
-            script_metrics = count_lines(str(cs_file))
-            metrics.script_metrics.append(script_metrics)
-            metrics.total_scripts += 1
-            metrics.total_loc += script_metrics.lines_of_code
-            metrics.total_comments += script_metrics.comment_lines
-            
-            # Categorize by directory
-            relative_path = cs_file.relative_to(scripts_path)
-            directory = str(relative_path.parent)
-            metrics.scripts_by_directory[directory].append(cs_file.name)
+    relative_paths = [cs_file.relative_to(scripts_path) for cs_file in cs_files]
+    lines_only = [not _LINES_ONLY_DIRS.isdisjoint(relative_path.parts[:-1])
+                  for relative_path in relative_paths]
+    results = _analyze_scripts([str(cs_file) for cs_file in cs_files], lines_only, assets_path, use_cache)
+    
+    for relative_path, script_metrics in zip(relative_paths, results):
+        script_metrics.name = relative_path.name
+        metrics.total_scripts += 1
+        metrics.total_loc += script_metrics.lines_of_code
+        metrics.total_comments += script_metrics.comment_lines
+        
+        # Categorize by directory
+        directory = str(relative_path.parent)
+        metrics.scripts_by_directory[directory].append(relative_path.name)
+        
+        if script_metrics.lines_only:
+            metrics.lines_only_scripts.append(script_metrics)
+            continue
+        
+        metrics.script_metrics.append(script_metrics)
     
     # Count other assets
-    metrics.prefab_count = len(list(assets_path.rglob("*.prefab")))
-    metrics.scene_count = len(list(assets_path.rglob("*.unity")))
-    metrics.animation_count = len(list(assets_path.rglob("*.anim")))
-    metrics.material_count = len(list(assets_path.rglob("*.mat")))
+    metrics.prefab_count = extension_counts['.prefab']
+    metrics.scene_count = extension_counts['.unity']
+    metrics.animation_count = extension_counts['.anim']
+    metrics.material_count = extension_counts['.mat']
     
     return metrics
 
 def print_report(metrics: ProjectMetrics, project_path: str):
     """Print a formatted report of the project metrics."""
-    print("=" * 80)
-    print(f"UNITY PROJECT ANALYSIS: {project_path}")
-    print("=" * 80)
-    print()
-    
-    print("PROJECT OVERVIEW")
-    print("-" * 80)
-    print(f"Total C# Scripts:     {metrics.total_scripts}")
-    print(f"Total Lines of Code:  {metrics.total_loc:,}")
-    print(f"Total Comment Lines:  {metrics.total_comments:,}")
-    print(f"Average LOC/Script:   {metrics.total_loc // metrics.total_scripts if metrics.total_scripts > 0 else 0}")
-    print()
-    
-    print(f"Prefabs:             {metrics.prefab_count}")
-    print(f"Scenes:              {metrics.scene_count}")
-    print(f"Animations:          {metrics.animation_count}")
-    print(f"Materials:           {metrics.material_count}")
-    print()
-    
-    print("SCRIPT ORGANIZATION")
-    print("-" * 80)
+    # Build the report in memory and write it to stdout in one call
+    report = io.StringIO()
+    emit = functools.partial(print, file=report)
+    
+    emit("=" * 80)
+    emit(f"UNITY PROJECT ANALYSIS: {project_path}")
+    emit("=" * 80)
+    emit()
+    
+    emit("PROJECT OVERVIEW")
+    emit("-" * 80)
+    emit(f"Total C# Scripts:     {metrics.total_scripts}")
+    emit(f"Total Lines of Code:  {metrics.total_loc:,}")
+    emit(f"Total Comment Lines:  {metrics.total_comments:,}")
+    emit(f"Average LOC/Script:   {metrics.total_loc // metrics.total_scripts if metrics.total_scripts > 0 else 0}")
+    if metrics.lines_only_scripts:
+        emit(f"Line Counts Only:     {len(metrics.lines_only_scripts)} (generated, third-party or over {_LINES_ONLY_OVER_BYTES:,} bytes)")
+    emit()
+    
+    emit(f"Prefabs:             {metrics.prefab_count}")
+    emit(f"Scenes:              {metrics.scene_count}")
+    emit(f"Animations:          {metrics.animation_count}")
+    emit(f"Materials:           {metrics.material_count}")
+    emit()
+    
+    emit("SCRIPT ORGANIZATION")
+    emit("-" * 80)
     for directory, scripts in sorted(metrics.scripts_by_directory.items()):
         if directory == ".":
             directory = "Scripts (root)"
-        print(f"{directory}/")
-        print(f"  Scripts: {len(scripts)}")
-    print()
+        emit(f"{directory}/")
+        emit(f"  Scripts: {len(scripts)}")
+    emit()
     
-    print("TOP 10 LARGEST SCRIPTS")
-    print("-" * 80)
-    sorted_scripts = sorted(metrics.script_metrics, key=lambda x: x.lines_of_code, reverse=True)[:10]
+    emit("TOP 10 LARGEST SCRIPTS")
+    emit("-" * 80)
+    sorted_scripts = heapq.nlargest(10, metrics.script_metrics, key=lambda x: x.lines_of_code)
     for i, script in enumerate(sorted_scripts, 1):
-        script_name = Path(script.path).name
-        print(f"{i:2}. {script_name:40} {script.lines_of_code:6} LOC")
-    print()
+        emit(f"{i:2}. {script.name:40} {script.lines_of_code:6} LOC")
+    emit()
     
-    print("TOP 10 MOST COMPLEX SCRIPTS")
-    print("-" * 80)
-    sorted_by_complexity = sorted(metrics.script_metrics, key=lambda x: x.complexity, reverse=True)[:10]
+    emit("TOP 10 MOST COMPLEX SCRIPTS")
+    emit("-" * 80)
+    sorted_by_complexity = heapq.nlargest(10, metrics.script_metrics, key=lambda x: x.complexity)
     for i, script in enumerate(sorted_by_complexity, 1):
-        script_name = Path(script.path).name
-        print(f"{i:2}. {script_name:40} Complexity: {script.complexity}")
-    print()
+        emit(f"{i:2}. {script.name:40} Complexity: {script.complexity}")
+    emit()
     
-    print("COMMON DEPENDENCIES (Top 15)")
-    print("-" * 80)
-    all_dependencies = defaultdict(int)
+    emit("COMMON DEPENDENCIES (Top 15)")
+    emit("-" * 80)
+    all_dependencies = Counter()
     for script in metrics.script_metrics:
-        for dep in script.dependencies:
-            all_dependencies[dep] += 1
+        all_dependencies.update(script.dependencies)
     
-    sorted_deps = sorted(all_dependencies.items(), key=lambda x: x[1], reverse=True)[:15]
+    sorted_deps = all_dependencies.most_common(15)
     for dep, count in sorted_deps:
-        print(f"{dep:40} Used in {count} files")
-    print()
+        emit(f"{dep:40} Used in {count} files")
+    emit()
     
-    print("CODE QUALITY METRICS")
-    print("-" * 80)
+    emit("CODE QUALITY METRICS")
+    emit("-" * 80)
     avg_complexity = sum(s.complexity for s in metrics.script_metrics) / len(metrics.script_metrics) if metrics.script_metrics else 0
     avg_methods = sum(s.method_count for s in metrics.script_metrics) / len(metrics.script_metrics) if metrics.script_metrics else 0
     comment_ratio = (metrics.total_comments / metrics.total_loc * 100) if metrics.total_loc > 0 else 0
     
-    print(f"Average Complexity per Script:  {avg_complexity:.2f}")
-    print(f"Average Methods per Script:     {avg_methods:.2f}")
-    print(f"Comment to Code Ratio:          {comment_ratio:.2f}%")
-    print()
+    emit(f"Average Complexity per Script:  {avg_complexity:.2f}")
+    emit(f"Average Methods per Script:     {avg_methods:.2f}")
+    emit(f"Comment to Code Ratio:          {comment_ratio:.2f}%")
+    emit()
     
     # Identify potential issues
-    print("POTENTIAL ISSUES")
-    print("-" * 80)
+    emit("POTENTIAL ISSUES")
+    emit("-" * 80)
     large_scripts = [s for s in metrics.script_metrics if s.lines_of_code > 500]
     if large_scripts:
-        print(f"⚠ {len(large_scripts)} scripts exceed 500 LOC (consider refactoring)")
+        emit(f"⚠ {len(large_scripts)} scripts exceed 500 LOC (consider refactoring)")
         for script in large_scripts[:5]:
-            print(f"  - {Path(script.path).name}: {script.lines_of_code} LOC")
+            emit(f"  - {script.name}: {script.lines_of_code} LOC")
     
     complex_scripts = [s for s in metrics.script_metrics if s.complexity > 50]
     if complex_scripts:
-        print(f"⚠ {len(complex_scripts)} scripts have high complexity (>50)")
+        emit(f"⚠ {len(complex_scripts)} scripts have high complexity (>50)")
         for script in complex_scripts[:5]:
-            print(f"  - {Path(script.path).name}: Complexity {script.complexity}")
+            emit(f"  - {script.name}: Complexity {script.complexity}")
     
     low_comment_scripts = [s for s in metrics.script_metrics if s.lines_of_code > 100 and s.comment_lines < s.lines_of_code * 0.05]
     if low_comment_scripts:
-        print(f"⚠ {len(low_comment_scripts)} scripts lack sufficient comments (<5%)")
+        emit(f"⚠ {len(low_comment_scripts)} scripts lack sufficient comments (<5%)")
     
     if not large_scripts and not complex_scripts:
-        print("✓ No major issues detected!")
+        emit("✓ No major issues detected!")
+    
+    emit()
+    emit("=" * 80)
     
-    print()
-    print("=" * 80)
+    sys.stdout.write(report.getvalue())
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: python analyze_unity_project.py <path_to_unity_project>")
+        print("Usage: python analyze_unity_project.py <path_to_unity_project> [--no-cache]")
         sys.exit(1)
     
     project_path = sys.argv[1]
+    use_cache = "--no-cache" not in sys.argv
     
     if not os.path.exists(project_path):
         print(f"Error: Path '{project_path}' does not exist")
@@ -245,7 +435,7 @@ def main():
     print(f"Analyzing Unity project at: {project_path}")
     print("This may take a moment...\n")
     
-    metrics = analyze_unity_project(project_path)
+    metrics = analyze_unity_project(project_path, use_cache)
     print_report(metrics, project_path)
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+"""
+Shared C# patterns for the unit-testing helper scripts.
+
+Compiled once here and imported by suggest_tests.py and
+generate_test_boilerplate.py so both scripts match C# the same way.
+"""
+
+import re
+
+CLASS_RE = re.compile(r'class\s+(\w+)')
+# Captures (return type, method name) for each public method
+PUBLIC_METHOD_RE = re.compile(r'public\s+(?!class|interface|struct)(\w+)\s+(\w+)\s*\([^)]*\)')
+PROPERTY_RE = re.compile(r'public\s+(\w+)\s+(\w+)\s*\{\s*get')
+COROUTINE_RE = re.compile(r'IEnumerator\s+(\w+)\s*\(')
+PUBLIC_FIELD_RE = re.compile(r'public\s+(?!class|void|int|float|bool|string)\w+\s+\w+;')
+PUBLIC_STATIC_RE = re.compile(r'public static \w+')
+
+COLLISION_METHODS = ('OnCollisionEnter', 'OnCollisionExit', 'OnTriggerEnter', 'OnTriggerExit')
+
+# Literal markers that decide which suggestions apply
+MARKERS = (
+    'MonoBehaviour',
+    'IEnumerator',
+    'WaitForSeconds',
+    'UnityEvent',
+    '[SerializeField]',
+    'void Update()',
+    'void FixedUpdate()',
+    'static class',
+    'set',
+) + COLLISION_METHODS
+
+def scan_markers(cs_content):
+    """Return the set of MARKERS present in the C# source, checking each once."""
+    # Separate substring checks are deliberate. A str 'in' test is a C-level
+    # search that stops at the first hit, and it beats a single-pass regex
+    # alternation over the same literals.
+    return {marker for marker in MARKERS if marker in cs_content}
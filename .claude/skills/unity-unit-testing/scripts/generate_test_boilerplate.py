@@ -6,23 +6,23 @@ Usage:
     python generate_test_boilerplate.py <path_to_cs_file> [--output <output_path>]
 """
 
-import re
 import sys
 import os
 from pathlib import Path
 
+from _patterns import CLASS_RE, PUBLIC_METHOD_RE
+
 def extract_class_info(cs_content):
     """Extract class name and methods from C# file."""
     # Find class name
-    class_match = re.search(r'class\s+(\w+)', cs_content)
+    class_match = CLASS_RE.search(cs_content)
     if not class_match:
         return None, []
     
     class_name = class_match.group(1)
     
     # Find public methods (excluding constructors)
-    method_pattern = r'public\s+(?!class|interface|struct)\w+\s+(\w+)\s*\('
-    methods = re.findall(method_pattern, cs_content)
+    methods = [name for _, name in PUBLIC_METHOD_RE.findall(cs_content)]
     
     # Filter out constructors
     methods = [m for m in methods if m != class_name]
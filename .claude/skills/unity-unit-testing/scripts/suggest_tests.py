@@ -6,24 +6,37 @@ Usage:
     python suggest_tests.py <path_to_cs_file>
 """
 
-import re
 import sys
 import os
 
+from _patterns import (
+    CLASS_RE,
+    COLLISION_METHODS,
+    COROUTINE_RE,
+    PROPERTY_RE,
+    PUBLIC_FIELD_RE,
+    PUBLIC_METHOD_RE,
+    PUBLIC_STATIC_RE,
+    scan_markers,
+)
+
 def analyze_class(cs_content):
     """Analyze C# class and suggest tests."""
     suggestions = []
     
     # Extract class name
-    class_match = re.search(r'class\s+(\w+)', cs_content)
+    class_match = CLASS_RE.search(cs_content)
     if not class_match:
         return ["Could not find class definition"]
     
     class_name = class_match.group(1)
     suggestions.append(f"=== Testing Suggestions for {class_name} ===\n")
     
+    # Look up every literal marker once instead of rescanning per check
+    markers = scan_markers(cs_content)
+    
     # Check if MonoBehaviour
-    if 'MonoBehaviour' in cs_content:
+    if 'MonoBehaviour' in markers:
         suggestions.append("✓ MonoBehaviour detected")
         suggestions.append("  - Test component initialization in SetUp")
         suggestions.append("  - Test Awake() initialization if present")
@@ -31,8 +44,7 @@ def analyze_class(cs_content):
         suggestions.append("  - Create and destroy GameObject in SetUp/TearDown\n")
     
     # Find public methods
-    method_pattern = r'public\s+(?!class|interface|struct)(\w+)\s+(\w+)\s*\([^)]*\)'
-    methods = re.findall(method_pattern, cs_content)
+    methods = PUBLIC_METHOD_RE.findall(cs_content)
     
     if methods:
         suggestions.append("Public Methods to Test:")
@@ -58,21 +70,19 @@ def analyze_class(cs_content):
         suggestions.append("")
     
     # Find public properties
-    property_pattern = r'public\s+(\w+)\s+(\w+)\s*\{\s*get'
-    properties = re.findall(property_pattern, cs_content)
+    properties = PROPERTY_RE.findall(cs_content)
     
     if properties:
         suggestions.append("Public Properties to Test:")
         for prop_type, prop_name in properties:
             suggestions.append(f"  • {prop_name}")
             suggestions.append(f"    - Test initial value")
-            if 'set' in cs_content:
+            if 'set' in markers:
                 suggestions.append(f"    - Test setting and getting value")
         suggestions.append("")
     
     # Check for coroutines
-    coroutine_pattern = r'IEnumerator\s+(\w+)\s*\('
-    coroutines = re.findall(coroutine_pattern, cs_content)
+    coroutines = COROUTINE_RE.findall(cs_content)
     
     if coroutines:
         suggestions.append("⚠ Coroutines detected - Use [UnityTest]:")
@@ -80,20 +90,19 @@ def analyze_class(cs_content):
             suggestions.append(f"  • {coroutine}()")
             suggestions.append(f"    - Test coroutine completion")
             suggestions.append(f"    - Test state changes during execution")
-            if 'WaitForSeconds' in cs_content:
+            if 'WaitForSeconds' in markers:
                 suggestions.append(f"    - Test timing/delays")
         suggestions.append("")
     
     # Check for Unity events
-    if 'UnityEvent' in cs_content:
+    if 'UnityEvent' in markers:
         suggestions.append("⚠ Unity Events detected:")
         suggestions.append("  - Test that events are invoked when expected")
         suggestions.append("  - Test event listeners receive correct parameters")
         suggestions.append("")
     
     # Check for collision/trigger methods
-    collision_methods = ['OnCollisionEnter', 'OnCollisionExit', 'OnTriggerEnter', 'OnTriggerExit']
-    found_collision = [m for m in collision_methods if m in cs_content]
+    found_collision = [m for m in COLLISION_METHODS if m in markers]
     if found_collision:
         suggestions.append("⚠ Collision/Trigger methods detected:")
         for method in found_collision:
@@ -104,21 +113,21 @@ def analyze_class(cs_content):
         suggestions.append("")
     
     # Check for SerializeField or public fields
-    if '[SerializeField]' in cs_content or re.search(r'public\s+(?!class|void|int|float|bool|string)\w+\s+\w+;', cs_content):
+    if '[SerializeField]' in markers or PUBLIC_FIELD_RE.search(cs_content):
         suggestions.append("⚠ Serialized/Public fields detected:")
         suggestions.append("  - Consider testing field initialization")
         suggestions.append("  - Test behavior with null/unassigned references")
         suggestions.append("")
     
     # Check for Update methods
-    if 'void Update()' in cs_content or 'void FixedUpdate()' in cs_content:
+    if 'void Update()' in markers or 'void FixedUpdate()' in markers:
         suggestions.append("⚠ Update method detected:")
         suggestions.append("  - Consider PlayMode tests for frame-by-frame behavior")
         suggestions.append("  - Test state changes over multiple frames")
         suggestions.append("")
     
     # Check for static methods/classes
-    if 'static class' in cs_content or re.search(r'public static \w+', cs_content):
+    if 'static class' in markers or PUBLIC_STATIC_RE.search(cs_content):
         suggestions.append("⚠ Static methods/class detected:")
         suggestions.append("  - Use simple EditMode tests")
         suggestions.append("  - Test pure functions with various inputs")
@@ -135,8 +144,8 @@ def analyze_class(cs_content):
     suggestions.append("")
     
     # Suggest test type
-    if 'MonoBehaviour' in cs_content:
-        if any(m in cs_content for m in collision_methods) or 'IEnumerator' in cs_content:
+    if 'MonoBehaviour' in markers:
+        if found_collision or 'IEnumerator' in markers:
             suggestions.append("Recommended Test Mode: PlayMode (requires Unity runtime)")
         else:
             suggestions.append("Recommended Test Mode: EditMode (faster, preferred)")